@@ -1,17 +1,124 @@
 # === Imports ===
 import customtkinter as ctk
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 import serial
 import serial.tools.list_ports
+import tkinter as tk
 from tkinter import messagebox, filedialog
 import sys
 import os
-import time
+import re
 import csv
+import queue
+import threading
+import concurrent.futures
+from types import MappingProxyType
 from fpdf import FPDF
 import datetime
 
 
+# Sentinel posted on the serial queue when the measurement window expires
+_MEASUREMENT_DONE = object()
+
+# Precompiled matchers so the streaming path never pays for a raised
+# ValueError on the (frequent) non-numeric status lines
+_NUM_RE = re.compile(r'^-?\d+(?:\.\d+)?$')
+_ANGLE_RE = re.compile(r'ANGLE:\s*(-?\d+(?:\.\d+)?)')
+
+# Movement table, frozen at module scope. Letters are bytes so ser.write
+# needs no per-call encode. Both deviations send b'z': the firmware measures
+# radial and ulnar with the same command (and b'r' is taken by recalibrate),
+# so they only get distinct letters once the sketch learns them.
+_MOVEMENTS = (
+    ("Wrist Flexion", b'f'),
+    ("Wrist Extension", b'e'),
+    ("Forearm Supination", b's'),
+    ("Forearm Pronation", b'p'),
+    ("Elbow Flexion", b'x'),
+    ("Elbow Extension", b'y'),
+    ("Radial Deviation", b'z'),
+    ("Ulnar Deviation", b'z'),
+)
+
+# Movement letter -> instruction image, read-only
+_IMAGE_MAPPING = MappingProxyType({
+    b'f': "images/WristMovements.png",
+    b'e': "images/WristMovements.png",
+    b's': "images/ForearmMoves.png",
+    b'p': "images/ForearmMoves.png",
+    b'x': "images/elborom.png",
+    b'y': "images/elborom.png",
+    b'z': "images/UlnarRadialMove.png",
+})
+
+# Full-scale deflection of the arc gauges, in degrees
+ROM_MAX = 180.0
+
+# Fonts used by the ROM panel, built once instead of per widget/item
+TITLE_FONT = ("Arial", 18, "bold")
+GAUGE_FONT = ("Arial", 14)
+GAUGE_VALUE_FONT = ("Arial", 16, "bold")
+LIVE_VALUE_FONT = ("Arial", 24, "bold")
+
+# Arc gauge palette and the live canvas bounding box, shared by every draw
+GAUGE_BG_COLOR = "#CCCCCC"
+GAUGE_FG_COLOR = "#00BFFF"
+LIVE_ARC_BBOX = (10, 10, 190, 190)
+
+# Pre-rendered foreground-arc frames for the ROM gauges, one per integer
+# degree, rendered lazily on first use and shared by all eight gauges.
+# Updating a gauge then swaps an image reference instead of having Tk
+# re-rasterize a 15px arc stroke.
+_GAUGE_FRAME_SIZE = 146
+_GAUGE_FRAMES = {}
+
+
+def _gauge_degree(angle):
+    """Clamp an angle to the gauge scale and quantize it to a whole degree."""
+    return max(0, min(int(ROM_MAX), int(round(angle))))
+
+
+def _gauge_frame(deg):
+    """Return the arc frame for a _gauge_degree value, rendering and caching it if new."""
+    frame = _GAUGE_FRAMES.get(deg)
+    if frame is None:
+        image = Image.new("RGBA", (_GAUGE_FRAME_SIZE, _GAUGE_FRAME_SIZE), (0, 0, 0, 0))
+        if deg > 0:
+            # Tk sweeps counterclockwise from 3 o'clock; PIL clockwise, so
+            # the same sweep runs from 360-deg up to 360. PIL strokes inward
+            # from its bbox while Tk centers the stroke on the path, so the
+            # bbox is padded by half the 15px width to keep this ring
+            # concentric with the Tk backdrop arc.
+            draw = ImageDraw.Draw(image)
+            draw.arc((0.5, 0.5, _GAUGE_FRAME_SIZE - 0.5, _GAUGE_FRAME_SIZE - 0.5),
+                     start=360 - deg, end=360, fill=GAUGE_FG_COLOR, width=15)
+        frame = ImageTk.PhotoImage(image)
+        _GAUGE_FRAMES[deg] = frame
+    return frame
+
+
+# Every image the UI uses; decoded in the background while the UI is built
+_IMAGE_PATHS = (
+    "images/WristMovements.png",
+    "images/ForearmMoves.png",
+    "images/elborom.png",
+    "images/UlnarRadialMove.png",
+    "images/AppLogo.png",
+    "images/bluetooth.png",
+)
+
+
+def _load_image(path):
+    """Worker: open a PIL image and force the pixel decode to happen here.
+
+    Image.open is lazy and only reads the header; without load() the actual
+    decode would run at first use, back on the Tk thread.
+    """
+    image = Image.open(path)
+    image.load()
+    return image
+
+
 #   ROM Calculation Functions 
 
 class ROMCalculator: #Handles calculation and display of Range of Motion (ROM) values.
@@ -19,53 +126,28 @@ class ROMCalculator: #Handles calculation and display of Range of Motion (ROM) v
     def __init__(self, app):
         self.app = app # Reference to main application for accessing entries and canvases
 
-    def safe_float(self, text): # convert text to float. Returns 0.0 on failure.
-        try:
-            return float(text)
-        except (ValueError, TypeError):
-            return 0.0
-
-    def calculate_rom_side(self, entries_list):
+    def calculate_rom_side(self, angles):
         '''
-        Calculate total ROM per joint group:
+        Calculate total ROM per joint group from a list of 8 angle floats:
         - Wrist: Flexion + Extension
         - Forearm: Supination + Pronation
         - Elbow: Average of Flexion and Extension
         - Wrist Deviation: Radial + Ulnar
         '''
-        wrist = self.safe_float(entries_list[0].get()) + self.safe_float(entries_list[1].get())
-        forearm = self.safe_float(entries_list[2].get()) + self.safe_float(entries_list[3].get())
-        elbow = (self.safe_float(entries_list[4].get()) + self.safe_float(entries_list[5].get())) / 2
-        wrist_deviation = self.safe_float(entries_list[6].get()) + self.safe_float(entries_list[7].get())
-
         return {
-            "ROM Wrist": wrist,
-            "ROM Forearm": forearm,
-            "ROM Elbow": elbow,
-            "ROM Wrist Deviation": wrist_deviation,
+            "ROM Wrist": angles[0] + angles[1],
+            "ROM Forearm": angles[2] + angles[3],
+            "ROM Elbow": (angles[4] + angles[5]) / 2,
+            "ROM Wrist Deviation": angles[6] + angles[7],
         }
 
 
-    def update_rom_display(self): #Refresh all ROM gauges using current entry values for both sides
-        try:
-            # Calculate ROM for unaffected side
-            unaffected_roms = self.calculate_rom_side(self.app.unaffected_angle_entries)
-            # Update ROM gauges
-            self.app.update_rom_gauge(self.app.unaffected_rom_canvases[0], unaffected_roms["ROM Wrist"])
-            self.app.update_rom_gauge(self.app.unaffected_rom_canvases[1], unaffected_roms["ROM Forearm"])
-            self.app.update_rom_gauge(self.app.unaffected_rom_canvases[2], unaffected_roms["ROM Elbow"])
-            self.app.update_rom_gauge(self.app.unaffected_rom_canvases[3], unaffected_roms["ROM Wrist Deviation"])
-
-            # Calculate ROM for affected side
-            affected_roms = self.calculate_rom_side(self.app.affected_angle_entries)
-            # Update ROM gauges
-            self.app.update_rom_gauge(self.app.affected_rom_canvases[0], affected_roms["ROM Wrist"])
-            self.app.update_rom_gauge(self.app.affected_rom_canvases[1], affected_roms["ROM Forearm"])
-            self.app.update_rom_gauge(self.app.affected_rom_canvases[2], affected_roms["ROM Elbow"])
-            self.app.update_rom_gauge(self.app.affected_rom_canvases[3], affected_roms["ROM Wrist Deviation"])
-
-        except Exception as e:
-            messagebox.showerror("Error", f"ROM update error:\n{e}")
+    def update_rom_display(self): #Refresh all ROM gauges using the cached angle values for both sides
+        # Calculate ROM for both sides and refresh all gauges in one batch
+        self.app.update_all_gauges(
+            self.calculate_rom_side(self.app.unaffected_angles),
+            self.calculate_rom_side(self.app.affected_angles),
+        )
 
 
 
@@ -80,17 +162,42 @@ class App(ctk.CTk):
         self.movement_letter = None              # Movement command to send 
         self.selected_movement = None            # Index of selected movement
         self.selected_side = None                # 'affected' or 'unaffected'
-        self.serial_read_start_time = None       # When serial read starts
-        self.serial_full_response = ""           # Accumulated serial output
+        self._serial_lines = []                  # Accumulated serial lines, joined at finalization
         self.serial_read_duration = 7000         # Read window in milliseconds
         self.serial_read_mode = "measurement"    # 'measurement' or 'calibration'
         self.rom_calculator = ROMCalculator(self)
 
+        # --- Serial Reader Thread State ---
+        self._serial_queue = queue.Queue()       # Lines handed from reader thread to Tk thread
+        self._serial_stop = threading.Event()    # Signals the reader thread to exit
+        self._serial_thread = None               # Background reader thread (started on connect)
+        self._serial_drain_after = None          # after() id of the pending queue-drain tick
+        self._measurement_timer = None           # threading.Timer closing the measurement window
+
+        # --- Cached Canvas Item IDs ---
+        self._live_canvas_ids = None             # (fg_arc_id, text_id) on live_canvas
+        self._last_live_angle = None             # Last angle drawn on live_canvas
+
+        # --- Background I/O ---
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._pending_exports = 0                # Export jobs still running
+        self._export_failed = False              # Any job of the current batch errored
+        self._cached_ports = []                  # Last COM port enumeration result
+
+        # --- Measured Angles ---
+        # One float per movement, kept in sidebar order. These are the source
+        # of truth for ROM maths; the Entry widgets only mirror them for display.
+        self.unaffected_angles = [0.0] * 8
+        self.affected_angles = [0.0] * 8
+
         # --- UI Entry & Canvas State ---
         self.unaffected_angle_entries = []       # Entry widgets for unaffected movements
         self.affected_angle_entries = []         # Entry widgets for affected movements
-        self.unaffected_rom_canvases = []        # ROM gauge canvases (unaffected)
-        self.affected_rom_canvases = []          # ROM gauge canvases (affected)
+        self.unaffected_angle_vars = []          # StringVars backing the unaffected entries
+        self.affected_angle_vars = []            # StringVars backing the affected entries
+        # Gauge records on rom_canvas, keyed by side and ROM label so callers
+        # address gauges by name rather than list position
+        self.rom_gauges = {"unaffected": {}, "affected": {}}
 
         # --- Appearance ---
         ctk.set_appearance_mode("light")
@@ -101,10 +208,36 @@ class App(ctk.CTk):
         self.geometry("1200x800")
         self.configure(bg='white')
 
+        # Kick off PNG decodes in the background so the window appears without
+        # waiting on disk I/O; each image is swapped in as its decode finishes.
+        self._movement_images = {}
+        for path in _IMAGE_PATHS:
+            future = self._io_executor.submit(_load_image, self.resource_path(path))
+            future.add_done_callback(
+                lambda f, p=path: self.after(0, lambda: self._install_image(p, f.result()))
+            )
+
         self.setup_ui()      # Build all GUI components
         self.mainloop()      # Start the application event loop
 
 
+    # === Movement Image Cache ===
+    def _install_image(self, path, image):
+        """Tk thread: wrap a decoded PIL image in a CTkImage and swap it into the UI."""
+        if path == "images/bluetooth.png":
+            icon = ctk.CTkImage(light_image=image, dark_image=image, size=(24, 24))
+            self._movement_images[path] = icon
+            self.connect_button.configure(image=icon)
+            return
+
+        photo = ctk.CTkImage(light_image=image, dark_image=image, size=(400, 300))
+        self._movement_images[path] = photo
+
+        # The logo doubles as the initial placeholder until a movement is picked
+        if path == "images/AppLogo.png" and self.selected_movement is None:
+            self.movement_image_placeholder.configure(image=photo, text="")
+
+
     # === Resource Path Helper ===
     def resource_path(self, relative_path):
         """
@@ -123,6 +256,22 @@ class App(ctk.CTk):
         """Return a list of available COM port device names."""
         return [port.device for port in serial.tools.list_ports.comports()]
 
+    def refresh_ports(self):
+        """Re-enumerate COM ports in the background and update the dropdown."""
+        future = self._io_executor.submit(self.list_ports)
+        future.add_done_callback(
+            lambda f: self.after(0, lambda ports=f.result(): self._set_ports(ports))
+        )
+
+    def _set_ports(self, ports):
+        self._cached_ports = ports
+        self.port_combobox.configure(values=ports)
+
+    def _on_port_dropdown(self, event=None):
+        """Populate the port list lazily the first time the dropdown is opened."""
+        if not self._cached_ports:
+            self.refresh_ports()
+
     def connect_bluetooth(self):
         """Attempt to connect to the selected Bluetooth COM port."""
         selected_port = self.port_combobox.get()
@@ -130,13 +279,38 @@ class App(ctk.CTk):
             messagebox.showerror("Error", "No COM port selected!")
             return
         try:
-            self.ser = serial.Serial(selected_port, 115200, timeout=10)
+            # Short timeout so the reader thread wakes up regularly to check the stop event
+            self.ser = serial.Serial(selected_port, 115200, timeout=0.1)
             self.connect_button.configure(text="Connected", fg_color="green")
+            self.start_serial_reader()
             messagebox.showinfo("Success", f"Connected to {selected_port}")
         except Exception as e:
             self.connect_button.configure(text="Disconnected", fg_color="red")
             messagebox.showerror("Connection Failed", str(e))
 
+    def start_serial_reader(self):
+        """Start the background serial reader thread and the Tk-side queue drain.
+
+        Reconnecting stops and joins any previous reader first so only one
+        thread ever reads a port, and the drain chain is scheduled at most
+        once no matter how many times the user connects.
+        """
+        if self._serial_thread is not None and self._serial_thread.is_alive():
+            self._serial_stop.set()
+            self._serial_thread.join()
+
+        # Fresh Event and explicit port/stop arguments: a stopped thread keeps
+        # its own flag and serial object, so it can never read the new port
+        self._serial_stop = threading.Event()
+        self._serial_thread = threading.Thread(
+            target=self._serial_reader_loop,
+            args=(self.ser, self._serial_stop),
+            daemon=True,
+        )
+        self._serial_thread.start()
+        if self._serial_drain_after is None:
+            self._drain_serial_queue()
+
 
 
     # === UI Setup Functions ===
@@ -151,82 +325,147 @@ class App(ctk.CTk):
 
 
     # === Serial Reading Functions ===
-    def read_serial_live(self):
-        """Read serial output live and update UI with incoming angles."""
-        if self.ser is None or not self.ser.is_open:
-            return
+    def _serial_reader_loop(self, ser, stop):
+        """Background thread: block-read pending bytes and hand whole lines to the Tk thread.
 
-        try:
-            while self.ser.in_waiting:
-                line = self.ser.readline().decode(errors='ignore').strip()
-                self.serial_full_response += line + "\n"
-
-                self.serial_output_box.configure(state="normal")
-                self.serial_output_box.insert("end", line + "\n")
-                self.serial_output_box.see("end")
-                self.serial_output_box.configure(state="disabled")
-
-                try:
-                    angle = float(line)
-                    self.update_live_angle(angle)
-                except ValueError:
+        Reading everything in_waiting at once sidesteps pyserial's slow
+        byte-at-a-time readline path on Windows; line splitting happens here
+        in Python on the accumulated buffer.
+        """
+        pending = bytearray()
+        while not stop.is_set():
+            try:
+                data = ser.read(ser.in_waiting or 1)
+            except Exception as e:
+                # Never pop a modal from the reader; surface it on the status
+                # line and flip the button back so a reconnect is the obvious move
+                self._set_status(f"Serial error: {e}")
+                self.after(0, lambda: self.connect_button.configure(text="Disconnected", fg_color="red"))
+                break
+
+            if not data:
+                continue  # read timeout with no data
+
+            pending += data
+            while (newline := pending.find(b"\n")) >= 0:
+                raw_line = bytes(pending[:newline])
+                del pending[:newline + 1]
+
+                line = raw_line.decode(errors='ignore').strip()
+                if not line:
                     continue
-        except Exception as e:
-            messagebox.showerror("Error", f"Serial reading error:\n{e}")
+                maybe_float = float(line) if _NUM_RE.match(line) else None
+                self._serial_queue.put((line, maybe_float))
 
-        # Timer check: 
-        if (time.time() - self.serial_read_start_time) * 1000 >= self.serial_read_duration:
-            if self.serial_read_mode == "measurement":
-                self.process_final_serial_data()
-        else:
-            self.after(50, self.read_serial_live)
+    def _drain_serial_queue(self):
+        """Tk thread: pop queued serial lines and update the UI. Reschedules itself."""
+        if self._serial_stop.is_set():
+            self._serial_drain_after = None
+            return
+
+        # Coalesce everything queued since the last tick into one text insert
+        # and at most one live-angle redraw, instead of per-line Tcl calls.
+        text_batch = []
+        latest_angle = None
+        while True:
+            try:
+                item = self._serial_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is _MEASUREMENT_DONE:
+                if self.serial_read_mode == "measurement":
+                    self.process_final_serial_data()
+                continue
+
+            line, maybe_float = item
+            self._serial_lines.append(line)
+            text_batch.append(line)
+            if maybe_float is not None:
+                latest_angle = maybe_float
+
+        if text_batch:
+            self.serial_output_box.configure(state="normal")
+            self.serial_output_box.insert("end", "\n".join(text_batch) + "\n")
+            self.serial_output_box.see("end")
+            self.serial_output_box.configure(state="disabled")
+
+        if latest_angle is not None and latest_angle != self._last_live_angle:
+            self.update_live_angle(latest_angle)
+
+        self._serial_drain_after = self.after(16, self._drain_serial_queue)
+
+    def _start_measurement_timer(self):
+        """Arm the timer that closes the measurement window with a sentinel on the queue."""
+        if self._measurement_timer is not None:
+            self._measurement_timer.cancel()
+        self._measurement_timer = threading.Timer(
+            self.serial_read_duration / 1000,
+            lambda: self._serial_queue.put(_MEASUREMENT_DONE)
+        )
+        self._measurement_timer.daemon = True
+        self._measurement_timer.start()
+
+    def _set_status(self, message):
+        """Show a message on the status line. Safe to call from any thread."""
+        self.after(0, lambda: self._status_var.set(message))
+
+    def _cancel_measurement_timer(self):
+        """Cancel any pending measurement-window timer."""
+        if self._measurement_timer is not None:
+            self._measurement_timer.cancel()
+            self._measurement_timer = None
 
 
     def update_live_angle(self, angle):
         """Render the current angle as an arc and numeric label on canvas."""
-        self.live_canvas.delete("all")
-        self.live_canvas.create_arc(10, 10, 190, 190, start=0, extent=180, style='arc', outline="#CCCCCC", width=20)
-        extent_angle = (angle / 180) * 180
-        self.live_canvas.create_arc(10, 10, 190, 190, start=0, extent=extent_angle, style='arc', outline="#00BFFF", width=20)
-        self.live_canvas.create_text(100, 115, text=f"{angle:.1f}°", font=("Arial", 24, "bold"), fill="black")
+        # Clamp to the gauge range; Tk draws odd arcs for extents beyond 180
+        extent_angle = max(0.0, min(ROM_MAX, angle))
+        if self._live_canvas_ids is None:
+            # First call: add the dynamic items on top of the backdrop arc
+            # drawn at setup and cache their IDs; nothing is ever deleted
+            fg_id = self.live_canvas.create_arc(*LIVE_ARC_BBOX, start=0, extent=extent_angle, style='arc', outline=GAUGE_FG_COLOR, width=20)
+            text_id = self.live_canvas.create_text(100, 115, text=f"{angle:.1f}°", font=LIVE_VALUE_FONT, fill="black")
+            self._live_canvas_ids = (fg_id, text_id)
+        else:
+            # Incremental item updates are far cheaper than delete("all")+recreate
+            fg_id, text_id = self._live_canvas_ids
+            self.live_canvas.itemconfigure(fg_id, extent=extent_angle)
+            self.live_canvas.itemconfigure(text_id, text=f"{angle:.1f}°")
+        self._last_live_angle = angle
 
 
     def process_final_serial_data(self):
         """Parse final angle from serial data and update relevant entries and visuals."""
-        try:
-            lines = self.serial_full_response.strip().split("\n")
-            last_valid_angle = None
-
-            for line in reversed(lines):
-                if "ANGLE:" in line:
-                    try:
-                        angle_str = line.split("ANGLE:")[1].strip()
-                        last_valid_angle = float(angle_str)
-                        break
-                    except (IndexError, ValueError):
-                        continue
-
-            if last_valid_angle is None:
-                messagebox.showerror("Error", "No valid ANGLE data found!")
-                return
-
-            if self.selected_side == "unaffected":
-                entry = self.unaffected_angle_entries[self.selected_movement]
-            elif self.selected_side == "affected":
-                entry = self.affected_angle_entries[self.selected_movement]
-            else:
-                return
+        # Join the captured lines once, then locate the last "ANGLE:" tag
+        # with a single scan.
+        buf = "\n".join(self._serial_lines)
+        last_valid_angle = None
+
+        idx = buf.rfind("ANGLE:")
+        if idx >= 0:
+            match = _ANGLE_RE.match(buf, idx)
+            if match:
+                last_valid_angle = float(match.group(1))
+
+        if last_valid_angle is None:
+            self._set_status("No valid ANGLE data found!")
+            return
 
-            entry.configure(state="normal")
-            entry.delete(0, "end")
-            entry.insert(0, f"{last_valid_angle:.1f}")
-            entry.configure(state="readonly")
-            self.rom_calculator.update_rom_display()
+        if self.selected_side == "unaffected":
+            entry_var = self.unaffected_angle_vars[self.selected_movement]
+            self.unaffected_angles[self.selected_movement] = last_valid_angle
+        elif self.selected_side == "affected":
+            entry_var = self.affected_angle_vars[self.selected_movement]
+            self.affected_angles[self.selected_movement] = last_valid_angle
+        else:
+            return
 
-            self.update_live_angle(last_valid_angle)
+        self._set_status("")
+        entry_var.set(f"{last_valid_angle:.1f}")
+        self.rom_calculator.update_rom_display()
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Processing error:\n{e}")
+        self.update_live_angle(last_valid_angle)
 
 
 
@@ -234,18 +473,11 @@ class App(ctk.CTk):
     def clear_all_measurements(self):
         """Reset all entries, ROM gauges, and serial output."""
         try:
-            for entry, canvas in zip(self.unaffected_angle_entries, self.unaffected_rom_canvases):
-                entry.configure(state="normal")
-                entry.delete(0, "end")
-                entry.configure(state="readonly")
-                self.update_rom_gauge(canvas, 0)
-
-            for entry, canvas in zip(self.affected_angle_entries, self.affected_rom_canvases):
-                entry.configure(state="normal")
-                entry.delete(0, "end")
-                entry.configure(state="readonly")
-                self.update_rom_gauge(canvas, 0)
-
+            self._cancel_measurement_timer()
+            self.unaffected_angles[:] = [0.0] * 8
+            self.affected_angles[:] = [0.0] * 8
+            self._refresh_entries()
+            self._refresh_gauges()
             self.update_live_angle(0)
 
             self.serial_output_box.configure(state="normal")
@@ -256,6 +488,30 @@ class App(ctk.CTk):
             messagebox.showerror("Error", f"Clear all error:\n{e}")
 
 
+    def _refresh_entries(self):
+        """Blank every angle entry via its StringVar — one Tcl call each."""
+        for var in self.unaffected_angle_vars:
+            var.set("")
+        for var in self.affected_angle_vars:
+            var.set("")
+
+    def _refresh_gauges(self):
+        """Reset every ROM gauge to zero through the cached item IDs."""
+        self.update_all_gauges({}, {})
+
+    def update_all_gauges(self, unaffected_roms, affected_roms):
+        """Refresh every gauge from the two ROM dicts, then flush one redraw pass.
+
+        update_idletasks coalesces the damage into a single frame; update()
+        would pump the whole event queue and is deliberately avoided.
+        """
+        for rom_key, gauge in self.rom_gauges["unaffected"].items():
+            self.draw_rom_gauge(gauge, unaffected_roms.get(rom_key, 0.0))
+        for rom_key, gauge in self.rom_gauges["affected"].items():
+            self.draw_rom_gauge(gauge, affected_roms.get(rom_key, 0.0))
+        self.main_area.update_idletasks()
+
+
 
     def redo_last_measurement(self):
         """Retry the last movement measurement."""
@@ -278,171 +534,166 @@ class App(ctk.CTk):
 
             self.ser.reset_input_buffer()
             self.ser.write(b'r')
-            self.ser.flush()
 
             self.serial_output_box.configure(state="normal")
             self.serial_output_box.delete("1.0", "end")
             self.serial_output_box.configure(state="disabled")
 
-            self.serial_read_start_time = time.time()
-            self.serial_full_response = ""
+            self._cancel_measurement_timer()
+            self._serial_lines.clear()
             self.serial_read_mode = "calibration"
-
-            self.read_serial_live()
         except Exception as e:
             messagebox.showerror("Error", f"Calibration error:\n{e}")
 
 
 
-    def export_to_csv(self):
-        """Export movement and ROM data to a CSV file."""
-        try:
-            patient_id = self.patient_id_entry.get().strip()
-            if not patient_id:
-                messagebox.showerror("Error", "Please enter a patient ID!")
-                return
+    def _export_snapshot(self):
+        """Collect everything the export workers need while still on the Tk thread."""
+        patient_id = self.patient_id_entry.get().strip()
+        if not patient_id:
+            messagebox.showerror("Error", "Please enter a patient ID!")
+            return None
 
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
-                initialfile=f"{patient_id}_DiagnosticTest.csv"
-            )
-            if not file_path:
-                return
+        return {
+            "patient_id": patient_id,
+            "unaffected": [entry.get() for entry in self.unaffected_angle_entries],
+            "affected": [entry.get() for entry in self.affected_angle_entries],
+            "unaffected_roms": self.rom_calculator.calculate_rom_side(self.unaffected_angles),
+            "affected_roms": self.rom_calculator.calculate_rom_side(self.affected_angles),
+        }
 
-            movements = [
-                "Wrist Flexion", "Wrist Extension",
-                "Forearm Supination", "Forearm Pronation",
-                "Elbow Flexion", "Elbow Extension",
-                "Radial Deviation", "Ulnar Deviation"
-            ]
-
-            with open(file_path, mode="w", newline="") as file:
-                writer = csv.writer(file)
-                writer.writerow(["Patient ID", patient_id])
-                writer.writerow([])
-                writer.writerow(["Movement Measurements"])
-                writer.writerow(["Movement", "Unaffected", "Affected"])
-
-                for i, movement in enumerate(movements):
-                    writer.writerow([
-                        movement,
-                        self.unaffected_angle_entries[i].get(),
-                        self.affected_angle_entries[i].get()
-                    ])
-
-                writer.writerow([])
-                writer.writerow(["Calculated ROM Values"])
-                writer.writerow(["ROM Type", "Unaffected", "Affected"])
-
-                for rom_label in ["ROM Wrist", "ROM Forearm", "ROM Elbow", "ROM Wrist Deviation"]:
-                    writer.writerow([
-                        rom_label,
-                        f"{self.rom_calculator.calculate_rom_side(self.unaffected_angle_entries).get(rom_label, 0):.1f}",
-                        f"{self.rom_calculator.calculate_rom_side(self.affected_angle_entries).get(rom_label, 0):.1f}"
-                    ])
-
-            messagebox.showinfo("Success", "Data exported successfully!")
+    def _on_export_done(self, future):
+        """Report the result of a finished export job back on the Tk thread."""
+        def report():
+            self._pending_exports -= 1
+            error = future.exception()
+            if error is not None:
+                self._export_failed = True
+                messagebox.showerror("Error", f"Export error:\n{error}")
+            elif self._pending_exports == 0 and not self._export_failed:
+                messagebox.showinfo("Success", "Data exported successfully!")
+        self.after(0, report)
+
+    def _write_csv(self, file_path, snapshot):
+        """Worker: write movement and ROM data to a CSV file. No Tk access here."""
+        unaffected_roms = snapshot["unaffected_roms"]
+        affected_roms = snapshot["affected_roms"]
+
+        # Assemble every row up front so serialization is one writerows call
+        rows = [
+            ["Patient ID", snapshot["patient_id"]],
+            [],
+            ["Movement Measurements"],
+            ["Movement", "Unaffected", "Affected"],
+        ]
+        rows += [
+            [movement, snapshot["unaffected"][i], snapshot["affected"][i]]
+            for i, (movement, _letter) in enumerate(_MOVEMENTS)
+        ]
+        rows += [
+            [],
+            ["Calculated ROM Values"],
+            ["ROM Type", "Unaffected", "Affected"],
+        ]
+        rows += [
+            [rom_label, f"{unaffected_roms.get(rom_label, 0):.1f}", f"{affected_roms.get(rom_label, 0):.1f}"]
+            for rom_label in ["ROM Wrist", "ROM Forearm", "ROM Elbow", "ROM Wrist Deviation"]
+        ]
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Export error:\n{e}")
+        # A buffer larger than the document means the OS sees one write call
+        with open(file_path, mode="w", newline="", buffering=1024 * 1024) as file:
+            csv.writer(file).writerows(rows)
 
     # === Export Measurements and ROM Data to PDF ===
 
 
-    def export_to_pdf(self):
-        """Export measurements and ROM calculations to a formatted PDF."""
-        try:
-            patient_id = self.patient_id_entry.get().strip()
-            if not patient_id:
-                messagebox.showerror("Error", "Please enter a patient ID!")
-                return
+    def _write_pdf(self, file_path, snapshot):
+        """Worker: write measurements and ROM calculations to a formatted PDF. No Tk access here."""
+        patient_id = snapshot["patient_id"]
+
+        pdf = FPDF()
+        pdf.add_page()
+        pdf.set_font("Arial", size=12)
+        pdf.cell(200, 10, txt="MedMove Diagnostics Report", ln=True, align="C")
+        pdf.ln(5)
+
+        current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+        pdf.set_font("Arial", size=10)
+        pdf.cell(200, 10, txt=f"Date: {current_date}", ln=True, align="C")
+        pdf.ln(10)
+
+        pdf.set_fill_color(220, 220, 220)
+        pdf.set_font("Arial", size=12)
+        pdf.cell(200, 10, txt=f"Patient ID: {patient_id}", ln=True, align="L", fill=True)
+        pdf.ln(10)
+
+        # Movements table
+        pdf.set_font("Arial", style="B", size=12)
+        pdf.cell(200, 10, txt="Movement Measurements", ln=True, align="L")
+        pdf.set_font("Arial", style="B", size=11)
+        pdf.cell(70, 8, "Movement", border=1, align="C")
+        pdf.cell(60, 8, "Unaffected", border=1, align="C")
+        pdf.cell(60, 8, "Affected", border=1, align="C")
+        pdf.ln(8)
+
+        pdf.set_font("Arial", size=11)
+        movements = [
+            "Wrist Flexion", "Wrist Extension",
+            "Forearm Supination", "Forearm Pronation",
+            "Elbow Flexion", "Elbow Extension",
+            "Radial Deviation", "Ulnar Deviation"
+        ]
 
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".pdf",
-                filetypes=[("PDF files", "*.pdf")],
-                initialfile=f"{patient_id}_DiagnosticTest.pdf"
-            )
-            if not file_path:
-                return
+        # Precompute the row strings so the render loop only issues cell calls
+        movement_rows = [
+            (movement, snapshot["unaffected"][i], snapshot["affected"][i])
+            for i, movement in enumerate(movements)
+        ]
+        self._render_pdf_rows(pdf, movement_rows)
 
-            pdf = FPDF()
-            pdf.add_page()
-            pdf.set_font("Arial", size=12)
-            pdf.cell(200, 10, txt="MedMove Diagnostics Report", ln=True, align="C")
-            pdf.ln(5)
-
-            current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-            pdf.set_font("Arial", size=10)
-            pdf.cell(200, 10, txt=f"Date: {current_date}", ln=True, align="C")
-            pdf.ln(10)
-
-            pdf.set_fill_color(220, 220, 220)
-            pdf.set_font("Arial", size=12)
-            pdf.cell(200, 10, txt=f"Patient ID: {patient_id}", ln=True, align="L", fill=True)
-            pdf.ln(10)
-
-            # Movements table
-            pdf.set_font("Arial", style="B", size=12)
-            pdf.cell(200, 10, txt="Movement Measurements", ln=True, align="L")
-            pdf.set_font("Arial", style="B", size=11)
-            pdf.cell(70, 8, "Movement", border=1, align="C")
-            pdf.cell(60, 8, "Unaffected", border=1, align="C")
-            pdf.cell(60, 8, "Affected", border=1, align="C")
-            pdf.ln(8)
-
-            pdf.set_font("Arial", size=11)
-            movements = [
-                "Wrist Flexion", "Wrist Extension",
-                "Forearm Supination", "Forearm Pronation",
-                "Elbow Flexion", "Elbow Extension",
-                "Radial Deviation", "Ulnar Deviation"
-            ]
-
-            for i, movement in enumerate(movements):
-                pdf.cell(70, 8, movement, border=1)
-                pdf.cell(60, 8, self.unaffected_angle_entries[i].get(), border=1, align="C")
-                pdf.cell(60, 8, self.affected_angle_entries[i].get(), border=1, align="C")
-                pdf.ln(8)
-
-            pdf.ln(10)
-
-            # ROM summary
-            pdf.set_font("Arial", style="B", size=12)
-            pdf.cell(200, 10, txt="Calculated ROM Values", ln=True, align="L")
-
-            pdf.set_font("Arial", style="B", size=11)
-            pdf.cell(70, 8, "ROM Type", border=1, align="C")
-            pdf.cell(60, 8, "Unaffected", border=1, align="C")
-            pdf.cell(60, 8, "Affected", border=1, align="C")
-            pdf.ln(8)
-
-            pdf.set_font("Arial", size=11)
-            unaffected_roms = self.rom_calculator.calculate_rom_side(self.unaffected_angle_entries)
-            affected_roms = self.rom_calculator.calculate_rom_side(self.affected_angle_entries)
-
-            for rom_label in ["ROM Wrist", "ROM Forearm", "ROM Elbow", "ROM Wrist Deviation"]:
-                pdf.cell(70, 8, rom_label, border=1)
-                pdf.cell(60, 8, f"{unaffected_roms.get(rom_label, 0):.1f}", border=1, align="C")
-                pdf.cell(60, 8, f"{affected_roms.get(rom_label, 0):.1f}", border=1, align="C")
-                pdf.ln(8)
-
-            pdf.output(file_path)
-            messagebox.showinfo("Success", "PDF exported successfully!")
+        pdf.ln(10)
 
-        except Exception as e:
-            messagebox.showerror("Error", f"PDF export error:\n{e}")
+        # ROM summary
+        pdf.set_font("Arial", style="B", size=12)
+        pdf.cell(200, 10, txt="Calculated ROM Values", ln=True, align="L")
+
+        pdf.set_font("Arial", style="B", size=11)
+        pdf.cell(70, 8, "ROM Type", border=1, align="C")
+        pdf.cell(60, 8, "Unaffected", border=1, align="C")
+        pdf.cell(60, 8, "Affected", border=1, align="C")
+        pdf.ln(8)
+
+        pdf.set_font("Arial", size=11)
+        unaffected_roms = snapshot["unaffected_roms"]
+        affected_roms = snapshot["affected_roms"]
+
+        rom_rows = [
+            (rom_label, f"{unaffected_roms.get(rom_label, 0):.1f}", f"{affected_roms.get(rom_label, 0):.1f}")
+            for rom_label in ["ROM Wrist", "ROM Forearm", "ROM Elbow", "ROM Wrist Deviation"]
+        ]
+        self._render_pdf_rows(pdf, rom_rows)
+
+        # Render to bytes in memory, then flush the document with one write
+        document = pdf.output(dest='S')
+        if isinstance(document, str):
+            document = document.encode("latin-1")
+        with open(file_path, "wb") as file:
+            file.write(bytes(document))
+
+    @staticmethod
+    def _render_pdf_rows(pdf, rows):
+        """Stream pre-formatted (label, unaffected, affected) rows into the PDF."""
+        cell = pdf.cell
+        ln = pdf.ln
+        for label, unaffected, affected in rows:
+            cell(70, 8, label, border=1)
+            cell(60, 8, unaffected, border=1, align="C")
+            cell(60, 8, affected, border=1, align="C")
+            ln(8)
 
 # --- End of PDF Export Function ---
 
 
-    def update_rom_gauge(self, canvas, angle):
-        """Draw updated ROM gauge with the given angle."""
-        canvas.delete("all")
-        canvas.create_arc(10, 10, 140, 140, start=0, extent=180, style='arc', outline="#CCCCCC", width=15)
-        extent_angle = (angle / 180) * 180
-        canvas.create_arc(10, 10, 140, 140, start=0, extent=extent_angle, style='arc', outline="#00BFFF", width=15)
-        canvas.create_text(75, 90, text=f"{angle:.1f}°", font=("Arial", 16, "bold"), fill="black")
 
 
 
@@ -453,28 +704,13 @@ class App(ctk.CTk):
         self.selected_movement = idx
         self.selected_side = side
 
-        # Map movement letters to images
-        image_mapping = {
-            'f': "images/WristMovements.png",
-            'e': "images/WristMovements.png",
-            's': "images/ForearmMoves.png",
-            'p': "images/ForearmMoves.png",
-            'x': "images/elborom.png",
-            'y': "images/elborom.png",
-            'z': "images/UlnarRadialMove.png",
-            'z': "images/UlnarRadialMove.png"
-            
-        }
-
         # Default image if no match found
-        image_path = image_mapping.get(letter, "images/AppLogo.png")
-
-        # Load and display movement image
-        movement_image = Image.open(self.resource_path(image_path))
-        movement_photo = ctk.CTkImage(light_image=movement_image, dark_image=movement_image, size=(400,300))
+        image_path = _IMAGE_MAPPING.get(letter, "images/AppLogo.png")
 
-        self.movement_image_placeholder.configure(image=movement_photo, text="")
-        self.movement_image_placeholder.image = movement_photo
+        # Display the pre-decoded movement image (skip if still decoding)
+        movement_photo = self._movement_images.get(image_path)
+        if movement_photo is not None:
+            self.movement_image_placeholder.configure(image=movement_photo, text="")
 
         # Update instruction label
         self.instruction_label.configure(text=f"Perform {movement_name}")
@@ -494,10 +730,10 @@ class App(ctk.CTk):
             return
 
         try:
-            # Reset and prepare serial communication
+            # Reset and prepare serial communication; write blocks until the
+            # OS accepts the byte, so no explicit flush is needed
             self.ser.reset_input_buffer()
-            self.ser.write(self.movement_letter.encode())
-            self.ser.flush()
+            self.ser.write(self.movement_letter)
 
             # Clear previous serial output box content
             self.serial_output_box.configure(state="normal")
@@ -505,12 +741,11 @@ class App(ctk.CTk):
             self.serial_output_box.configure(state="disabled")
 
             # Setup for live reading
-            self.serial_read_start_time = time.time()
-            self.serial_full_response = ""
+            self._serial_lines.clear()
             self.serial_read_mode = "measurement"  # Set mode to normal measurement
 
-            # Start reading serial data live
-            self.read_serial_live()
+            # Arm the measurement window; the reader thread is already running
+            self._start_measurement_timer()
 
         except Exception as e:
             messagebox.showerror("Error", f"Serial error:\n{e}")
@@ -533,24 +768,30 @@ class App(ctk.CTk):
         self.patient_id_entry = ctk.CTkEntry(master=left_top_frame, width=200, placeholder_text="Enter Patient ID")
         self.patient_id_entry.pack(side="left", padx=20)
 
-        # Port Combobox
+        # Port Combobox (populated lazily; enumeration can take hundreds of ms)
         self.port_combobox = ctk.CTkComboBox(master=left_top_frame, width=150, state="readonly")
         self.port_combobox.pack(side="left", padx=20)
-        self.port_combobox.configure(values=self.list_ports())
+        self.port_combobox.configure(values=self._cached_ports)
         self.port_combobox.set("Select COM Port")
+        self.port_combobox.bind("<Button-1>", self._on_port_dropdown, add="+")
 
-        # Connect Button with Bluetooth Icon
-        bluetooth_icon = ctk.CTkImage(
-            light_image=Image.open(self.resource_path("images/bluetooth.png")),
-            dark_image=Image.open(self.resource_path("images/bluetooth.png")),
-            size=(24, 24)
+        # Refresh Button for re-enumerating ports on demand
+        refresh_button = ctk.CTkButton(
+            master=left_top_frame,
+            text="Refresh",
+            width=80,
+            fg_color="#DDDDDD",
+            text_color="black",
+            hover_color="#CCCCCC",
+            command=self.refresh_ports
         )
+        refresh_button.pack(side="left")
 
+        # Connect Button; the Bluetooth icon is installed once its decode finishes
         self.connect_button = ctk.CTkButton(
             master=top_frame,
             text="Connect",
             command=self.connect_bluetooth,
-            image=bluetooth_icon,
             compound="left",
             width=140,
             height=40,
@@ -569,20 +810,8 @@ class App(ctk.CTk):
         self.sidebar_frame = ctk.CTkScrollableFrame(master=self.main_area, width=300, corner_radius=0, fg_color="#F5F5F5")
         self.sidebar_frame.pack(side="left", fill="y", padx=(10, 0), pady=10)
 
-        # Movements list
-        self.movements = [
-            ("Wrist Flexion", 'f'),
-            ("Wrist Extension", 'e'),
-            ("Forearm Supination", 's'),
-            ("Forearm Pronation", 'p'),
-            ("Elbow Flexion", 'x'),
-            ("Elbow Extension", 'y'),
-            ("Radial Deviation", 'z'),
-            ("Ulnar Deviation", 'z')
-        ]
-
         # Loop through each movement and create UI elements
-        for idx, (movement, letter) in enumerate(self.movements):
+        for idx, (movement, letter) in enumerate(_MOVEMENTS):
             # Movement label
             movement_label = ctk.CTkLabel(master=self.sidebar_frame, text=movement, font=("Arial", 16), text_color="black")
             movement_label.pack(padx=10, pady=(10, 2))
@@ -621,15 +850,20 @@ class App(ctk.CTk):
             angle_box_frame = ctk.CTkFrame(master=self.sidebar_frame, fg_color="#F5F5F5")
             angle_box_frame.pack(padx=10, pady=(0, 10))
 
-            # Entry for unaffected angle
-            unaffected_entry = ctk.CTkEntry(master=angle_box_frame, width=80, state="readonly", justify="center")
+            # Entry for unaffected angle. Backed by a StringVar so updates are a
+            # single var.set() rather than a state-normal/delete/state-readonly dance.
+            unaffected_var = tk.StringVar()
+            unaffected_entry = ctk.CTkEntry(master=angle_box_frame, width=80, state="readonly", justify="center", textvariable=unaffected_var)
             unaffected_entry.pack(side="left", padx=5)
             self.unaffected_angle_entries.append(unaffected_entry)
+            self.unaffected_angle_vars.append(unaffected_var)
 
             # Entry for affected angle
-            affected_entry = ctk.CTkEntry(master=angle_box_frame, width=80, state="readonly", justify="center")
+            affected_var = tk.StringVar()
+            affected_entry = ctk.CTkEntry(master=angle_box_frame, width=80, state="readonly", justify="center", textvariable=affected_var)
             affected_entry.pack(side="left", padx=5)
             self.affected_angle_entries.append(affected_entry)
+            self.affected_angle_vars.append(affected_var)
 
     
 
@@ -652,14 +886,9 @@ class App(ctk.CTk):
 
         self.center_frame.pack(side="left", expand=True, fill="both", padx=10, pady=10)
 
-        # Load initial logo image for placeholder
-        logo_image = Image.open(self.resource_path("images/AppLogo.png"))
-        logo_photo = ctk.CTkImage(light_image=logo_image, dark_image=logo_image, size=(400,300))
-
-        # Movement image placeholder
+        # Movement image placeholder; shows the logo once its decode finishes
         self.movement_image_placeholder = ctk.CTkLabel(
             master=self.center_frame,
-            image=logo_photo,
             text="",
             width=300,
             height=200,
@@ -689,6 +918,16 @@ class App(ctk.CTk):
         self.serial_output_box.insert("end", "Awaiting Movement Selection...\n")
         self.serial_output_box.configure(state="disabled")  # Make readonly initially
 
+        # Non-modal status line for measurement/serial errors
+        self._status_var = tk.StringVar()
+        status_label = ctk.CTkLabel(
+            master=self.center_frame,
+            textvariable=self._status_var,
+            font=("Arial", 12),
+            text_color="red"
+        )
+        status_label.pack(pady=(0, 2))
+
         # Live angle frame container
         live_angle_frame = ctk.CTkFrame(master=self.center_frame, fg_color="white")
         live_angle_frame.pack(pady=20)
@@ -698,7 +937,7 @@ class App(ctk.CTk):
         frame_pair.pack()
 
         # Live angle canvas for arc visualization
-        self.live_canvas = ctk.CTkCanvas(
+        self.live_canvas = tk.Canvas(
             master=frame_pair,
             width=200,
             height=150,
@@ -708,7 +947,7 @@ class App(ctk.CTk):
         self.live_canvas.pack(side="left", padx=10)
 
         # Draw static background arc
-        self.live_canvas.create_arc(10, 10, 190, 190, start=0, extent=180, style='arc', outline="#CCCCCC", width=20)
+        self.live_canvas.create_arc(*LIVE_ARC_BBOX, start=0, extent=180, style='arc', outline=GAUGE_BG_COLOR, width=20)
 
      
     def setup_center_bottom_buttons(self):
@@ -763,71 +1002,151 @@ class App(ctk.CTk):
 
 
     def handle_export(self):
-        """Handle export"""
-        
-        self.export_to_csv()
-    
-        self.export_to_pdf()
-        
+        """Snapshot the data, ask for both file paths, then export in the background."""
+        snapshot = self._export_snapshot()
+        if snapshot is None:
+            return
+
+        patient_id = snapshot["patient_id"]
+        csv_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            initialfile=f"{patient_id}_DiagnosticTest.csv"
+        )
+        pdf_path = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("PDF files", "*.pdf")],
+            initialfile=f"{patient_id}_DiagnosticTest.pdf"
+        )
+
+        # A cancelled dialog skips only that file; whatever the user confirmed
+        # still gets written. Jobs are submitted only after both dialogs close
+        # so the done-callbacks can't fire inside a dialog's nested event loop.
+        jobs = []
+        if csv_path:
+            jobs.append((self._write_csv, csv_path))
+        if pdf_path:
+            jobs.append((self._write_pdf, pdf_path))
+        if not jobs:
+            return
+
+        # The writers run off the Tk thread so the UI stays responsive
+        self._pending_exports = len(jobs)
+        self._export_failed = False
+        for writer, path in jobs:
+            future = self._io_executor.submit(writer, path, snapshot)
+            future.add_done_callback(self._on_export_done)
+
 
 
     #Setup the right panel .
     def setup_right_panel(self):
-        
 
-        # Right frame
+
+        # Right frame; fixed width, so keep it from shrinking to its children
         self.right_frame = ctk.CTkFrame(master=self.main_area, width=375, fg_color="#F5F5F5")
         self.right_frame.pack(side="left", fill="y", padx=10, pady=10)
+        self.right_frame.pack_propagate(False)
+
+        # One canvas hosts all eight gauges in a 2x4 grid: a single widget
+        # means one Tk item tree and one damage region instead of eight.
+        # place() pins it at fixed coordinates with no sibling reflow pass.
+        self.rom_canvas = tk.Canvas(master=self.right_frame, width=340, height=580, bg="#F5F5F5", highlightthickness=0)
+        self.rom_canvas.place(x=10, y=10)
+
+        # Populate the canvas in one idle pass once the mainloop is running,
+        # so window construction is not held up by 30-odd item creations
+        self.after_idle(self._init_gauges)
+
+        # Coalesce resize storms into one refresh; without the debounce every
+        # pixel of a drag would re-render all eight gauges
+        self._gauge_resize_after = None
+        self.rom_canvas.bind("<Configure>", self._on_rom_canvas_resize)
+
+    def _on_rom_canvas_resize(self, event=None):
+        """Debounce <Configure> events into one gauge refresh 50 ms after the last."""
+        if self._gauge_resize_after is not None:
+            self.after_cancel(self._gauge_resize_after)
+        self._gauge_resize_after = self.after(50, self._redraw_gauges_after_resize)
+
+    def _redraw_gauges_after_resize(self):
+        """Re-render every gauge at its last angle after a resize settles."""
+        self._gauge_resize_after = None
+        for side in self.rom_gauges.values():
+            for gauge in side.values():
+                last_angle = gauge["last_angle"]
+                gauge["last_angle"] = float("inf")  # defeat the unchanged-angle skip
+                gauge["last_deg"] = -1
+                gauge["last_text"] = None
+                self.draw_rom_gauge(gauge, last_angle)
+        self.main_area.update_idletasks()
+
+    def _init_gauges(self):
+        """Idle callback: create the titles and all eight gauges at zero."""
+        # Titles for each side
+        self.rom_canvas.create_text(85, 15, text="Unaffected ROM", font=TITLE_FONT, fill="black")
+        self.rom_canvas.create_text(250, 15, text="Affected ROM", font=TITLE_FONT, fill="black")
+
+        # Display label and the matching calculate_rom_side key per row
+        rom_labels = [
+            ("Wrist ROM", "ROM Wrist"),
+            ("Forearm ROM", "ROM Forearm"),
+            ("Elbow ROM", "ROM Elbow"),
+            ("Wrist Deviation ROM", "ROM Wrist Deviation"),
+        ]
 
-        # Container for two columns
-        rom_columns = ctk.CTkFrame(master=self.right_frame, fg_color="#F5F5F5")
-        rom_columns.pack(expand=True, fill="both", padx=10, pady=10)
-
-        # Left column for unaffected side
-        self.unaffected_frame = ctk.CTkFrame(master=rom_columns, fg_color="#F5F5F5")
-        self.unaffected_frame.pack(side="left", expand=True, fill="both", padx=5)
+        # Build both columns in one loop; locals beat attribute lookups in
+        # CPython and both sides share all per-row work
+        create_gauge = self._create_gauge
+        unaffected = self.rom_gauges["unaffected"]
+        affected = self.rom_gauges["affected"]
+        for gauge_idx, (label_text, rom_key) in enumerate(rom_labels):
+            y = 35 + gauge_idx * 135
+            unaffected[rom_key] = create_gauge(10, y, label_text)
+            affected[rom_key] = create_gauge(175, y, label_text)
+
+    def _create_gauge(self, x, y, label_text):
+        '''Create one gauge's canvas items at (x, y) and return its record.'''
+        canvas = self.rom_canvas
+        canvas.create_text(x + 75, y + 8, text=label_text, font=GAUGE_FONT, fill="black")
+        canvas.create_arc(x + 10, y + 18, x + 140, y + 148, start=0, extent=180, style='arc', outline=GAUGE_BG_COLOR, width=15)
+        fg_id = canvas.create_image(x + 75, y + 83, image=_gauge_frame(0))
+        text_id = canvas.create_text(x + 75, y + 98, text="0.0°", font=GAUGE_VALUE_FONT, fill="black")
+        return {
+            "fg": fg_id,
+            "text": text_id,
+            "x": x,
+            "y": y,
+            "last_angle": 0.0,
+            "last_deg": 0,     # degree of the frame currently shown
+            "last_text": 0.0,  # rounded value currently shown as text
+        }
 
-        # Right column for affected side
-        self.affected_frame = ctk.CTkFrame(master=rom_columns, fg_color="#F5F5F5")
-        self.affected_frame.pack(side="left", expand=True, fill="both", padx=5)
+    def draw_rom_gauge(self, gauge, angle):
+        '''Update one gauge record on the shared ROM canvas to show the angle.
 
-        # Titles for each side
-        unaffected_title = ctk.CTkLabel(master=self.unaffected_frame, text="Unaffected ROM", font=("Arial", 18, "bold"), text_color="black")
-        unaffected_title.pack(pady=(10, 5))
-
-        affected_title = ctk.CTkLabel(master=self.affected_frame, text="Affected ROM", font=("Arial", 18, "bold"), text_color="black")
-        affected_title.pack(pady=(10, 5))
-
-        # Labels for ROM types
-        rom_labels = ["Wrist ROM", "Forearm ROM", "Elbow ROM","Wrist Deviation ROM"]
-
-        # Build ROM gauges for unaffected side
-        for label_text in rom_labels:
-            label_widget = ctk.CTkLabel(master=self.unaffected_frame, text=label_text, font=("Arial", 14), text_color="black")
-            label_widget.pack(pady=(5, 0))
-
-            canvas = ctk.CTkCanvas(master=self.unaffected_frame, width=150, height=120, bg="#F5F5F5", highlightthickness=0)
-            canvas.pack(pady=(0, 10))
-            self.draw_rom_gauge(canvas, 0)  # Start with 0 degree
-            self.unaffected_rom_canvases.append(canvas)
-
-        # Build ROM gauges for affected side
-        for label_text in rom_labels:
-            label_widget = ctk.CTkLabel(master=self.affected_frame, text=label_text, font=("Arial", 14), text_color="black")
-            label_widget.pack(pady=(5, 0))
-
-            canvas = ctk.CTkCanvas(master=self.affected_frame, width=150, height=120, bg="#F5F5F5", highlightthickness=0)
-            canvas.pack(pady=(0, 10))
-            self.draw_rom_gauge(canvas, 0)  # Start with 0 degree
-            self.affected_rom_canvases.append(canvas)
-
-    def draw_rom_gauge(self, canvas, angle):
-        '''Draw an arc gauge representing the ROM angle on a canvas.'''
-        canvas.delete("all")  # Clear previous drawing
-        canvas.create_arc(10, 10, 140, 140, start=0, extent=180, style='arc', outline="#CCCCCC", width=15)
-        extent_angle = (angle / 180) * 180
-        canvas.create_arc(10, 10, 140, 140, start=0, extent=extent_angle, style='arc', outline="#00BFFF", width=15)
-        canvas.create_text(75, 90, text=f"{angle:.1f}°", font=("Arial", 16, "bold"), fill="black")
+        Only the foreground frame and the value text ever change; the label
+        and backdrop arc created in _create_gauge are never touched. The
+        frame swap is an image-pointer assignment — _gauge_frame rasterizes
+        at most once per integer degree, ever.
+        '''
+        # Skip the Tcl round-trips entirely when the gauge would look the
+        # same; 0.05 degrees is below the one-decimal display resolution
+        if abs(angle - gauge["last_angle"]) < 0.05:
+            return
+        gauge["last_angle"] = angle
+
+        # Frame and text change at different granularities (1° vs 0.1°), so
+        # each is touched only when its own displayed value actually moves
+        deg = _gauge_degree(angle)
+        if deg != gauge["last_deg"]:
+            self.rom_canvas.itemconfigure(gauge["fg"], image=_gauge_frame(deg))
+            gauge["last_deg"] = deg
+
+        rounded = round(angle, 1)
+        if rounded != gauge["last_text"]:
+            self.rom_canvas.itemconfigure(gauge["text"], text=f"{rounded}°")
+            gauge["last_text"] = rounded
 
     
 